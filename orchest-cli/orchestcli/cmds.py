@@ -44,8 +44,9 @@ ORCHEST_NAMESPACE = re.compile("(namespace: )([-a-z]+)")
 
 
 def _get_k8s_api_client(configuration: Configuration) -> ApiClient:
-    # Keep in sync with the one in
-    # services/orchest-api/app/app/connections.py.
+    # Keep the retry strategy in sync with the one in
+    # services/orchest-api/app/app/connections.py, the pool sizing done
+    # there is specific to the orchest-api.
     _retry_strategy = Retry(
         total=5,
         backoff_factor=1,
@@ -9,7 +9,9 @@ from urllib3.util.retry import Retry
 from _orchest.internals import config as _config
 
 
-# Keep in sync with the one in orchest-cli/orchestcli/cmds.py.
+# Keep the retry strategy in sync with the one in
+# orchest-cli/orchestcli/cmds.py, the pool sizing is specific to the
+# orchest-api.
 def _get_k8s_api_client() -> ApiClient:
     configuration = Configuration.get_default_copy()
     _retry_strategy = Retry(
@@ -18,7 +20,14 @@ def _get_k8s_api_client() -> ApiClient:
     )
     # See urllib3 poolmanager.py usage of "retries".
     configuration.retries = _retry_strategy
-    a = ApiClient(configuration=configuration)
+    # The default depends on the number of CPUs, make sure the pool can
+    # keep enough connections for the thread pool below and concurrent
+    # synchronous requests, otherwise the extra connections are opened
+    # and thrown away on every burst of requests.
+    configuration.connection_pool_maxsize = 32
+    # Used by requests made with async_req=True, e.g. when creating or
+    # deleting the resources of a session concurrently.
+    a = ApiClient(configuration=configuration, pool_threads=16)
     return a
 
 
@@ -1,9 +1,13 @@
+import json
+import threading
 import time
 from contextlib import contextmanager
-from typing import Callable, List, Optional
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import kubernetes
 import requests
+import urllib3
 
 from _orchest.internals import config as _config
 from app import errors, utils
@@ -13,6 +17,33 @@ from app.types import NonInteractiveSessionConfig, SessionConfig, SessionType
 
 logger = utils.get_logger()
 
+# (k8s API, resource) by kind of the resources that make up a session,
+# used to server-side apply their manifests.
+_KIND_TO_K8S_API_AND_RESOURCE = {
+    "Deployment": (k8s_apps_api, "deployments"),
+    "Ingress": (k8s_networking_api, "ingresses"),
+    "Role": (k8s_rbac_api, "roles"),
+    "RoleBinding": (k8s_rbac_api, "rolebindings"),
+    "Service": (k8s_core_api, "services"),
+    "ServiceAccount": (k8s_core_api, "serviceaccounts"),
+}
+
+# session_uuid -> (monotonic time of the query, has busy kernels), used
+# to coalesce queries for the same session made in a short time window.
+_busy_kernels_cache: Dict[str, Tuple[float, bool]] = {}
+_busy_kernels_cache_lock = threading.Lock()
+_BUSY_KERNELS_CACHE_TTL = 0.5
+
+# Client side timeouts of watch requests, in seconds. The read timeout
+# of a watch is its server side timeout plus the slack, so that stalled
+# connections don't block forever.
+_K8S_CONNECT_TIMEOUT = 5
+_WATCH_READ_TIMEOUT_SLACK = 2
+
+
+def _always_false(*args, **kwargs) -> bool:
+    return False
+
 
 def launch(
     session_uuid: str,
@@ -44,53 +75,22 @@ def launch(
             the cleanup_resources method if desired.
     """
     if should_abort is None:
+        should_abort = _always_false
 
-        def always_false(*args, **kwargs):
-            return False
-
-        should_abort = always_false
-
-    if session_type not in [SessionType.INTERACTIVE, SessionType.NONINTERACTIVE]:
+    try:
+        get_orchest_session_services_manifests = (
+            _ORCHEST_SESSION_SERVICES_MANIFESTS_GETTERS[session_type]
+        )
+    except KeyError:
         raise ValueError(f"Invalid session type: {session_type}.")
 
     # Internal Orchest session services.
-    orchest_session_service_k8s_deployment_manifests = []
-    orchest_session_service_k8s_service_manifests = []
-    orchest_session_service_k8s_ingress_manifests = []
-    session_rbac_roles = []
-    session_rbac_service_accounts = []
-    session_rbac_rolebindings = []
-
-    if session_type == SessionType.INTERACTIVE:
-        (
-            role,
-            service_account,
-            rolebinding,
-        ) = _manifests._get_jupyter_enterprise_gateway_rbac_manifests(
-            session_uuid, session_config
-        )
-        session_rbac_roles.append(role)
-        session_rbac_service_accounts.append(service_account)
-        session_rbac_rolebindings.append(rolebinding)
-
-        (
-            depl,
-            serv,
-        ) = _manifests._get_jupyter_enterprise_gateway_deployment_service_manifest(
-            session_uuid, session_config, session_type
-        )
-        orchest_session_service_k8s_deployment_manifests.append(depl)
-        orchest_session_service_k8s_service_manifests.append(serv)
-        (
-            depl,
-            serv,
-            ingress,
-        ) = _manifests._get_jupyter_server_deployment_service_manifest(
-            session_uuid, session_config
-        )
-        orchest_session_service_k8s_deployment_manifests.append(depl)
-        orchest_session_service_k8s_service_manifests.append(serv)
-        orchest_session_service_k8s_ingress_manifests.append(ingress)
+    (
+        session_rbac_manifests,
+        orchest_session_service_k8s_deployment_manifests,
+        orchest_session_service_k8s_service_manifests,
+        orchest_session_service_k8s_ingress_manifests,
+    ) = get_orchest_session_services_manifests(session_uuid, session_config)
 
     user_session_service_k8s_deployment_manifests = []
     user_session_service_k8s_service_manifests = []
@@ -111,14 +111,9 @@ def launch(
 
     if user_session_service_k8s_deployment_manifests:
         logger.info("Adding session sidecar to log user services.")
-        (
-            role,
-            service_account,
-            rolebinding,
-        ) = _manifests._get_session_sidecar_rbac_manifests(session_uuid, session_config)
-        session_rbac_roles.append(role)
-        session_rbac_service_accounts.append(service_account)
-        session_rbac_rolebindings.append(rolebinding)
+        session_rbac_manifests.extend(
+            _manifests._get_session_sidecar_rbac_manifests(session_uuid, session_config)
+        )
         orchest_session_service_k8s_deployment_manifests.append(
             _manifests._get_session_sidecar_deployment_manifest(
                 session_uuid, session_config, session_type
@@ -127,82 +122,88 @@ def launch(
 
     ns = _config.ORCHEST_NAMESPACE
 
-    logger.info("Creating session RBAC roles.")
-    for manifest in session_rbac_roles:
-        logger.info(f'Creating role {manifest["metadata"]["name"]}')
-        k8s_rbac_api.create_namespaced_role(ns, manifest)
-
-    logger.info("Creating session RBAC service accounts.")
-    for manifest in session_rbac_service_accounts:
-        logger.info(f'Creating service account {manifest["metadata"]["name"]}')
-        k8s_core_api.create_namespaced_service_account(ns, manifest)
-
-    logger.info("Creating session RBAC role bindings.")
-    for manifest in session_rbac_rolebindings:
-        logger.info(f'Creating role binding {manifest["metadata"]["name"]}')
-        k8s_rbac_api.create_namespaced_role_binding(ns, manifest)
-
-    logger.info("Creating Orchest session services deployments.")
-    for manifest in orchest_session_service_k8s_deployment_manifests:
-        logger.info(f'Creating deployment {manifest["metadata"]["name"]}')
-        k8s_apps_api.create_namespaced_deployment(
-            ns,
-            manifest,
-        )
+    # The RBAC resources are created first since the pods of the
+    # deployments can't be created without their service accounts.
+    logger.info("Creating session RBAC resources.")
+    _apply_manifests(ns, session_rbac_manifests)
+
+    logger.info("Creating user and orchest session services resources.")
+    _apply_manifests(
+        ns,
+        orchest_session_service_k8s_deployment_manifests
+        + user_session_service_k8s_deployment_manifests
+        + orchest_session_service_k8s_service_manifests
+        + user_session_service_k8s_service_manifests
+        + orchest_session_service_k8s_ingress_manifests
+        + user_session_service_k8s_ingress_manifests,
+    )
 
-    logger.info("Creating Orchest session services k8s services.")
-    for manifest in orchest_session_service_k8s_service_manifests:
-        logger.info(f'Creating service {manifest["metadata"]["name"]}')
-        k8s_core_api.create_namespaced_service(
-            ns,
-            manifest,
-        )
+    logger.info("Waiting for user and orchest session service deployments to be ready.")
+    _wait_for_deployments_rollout(
+        ns,
+        f"session_uuid={session_uuid}",
+        [
+            manifest["metadata"]["name"]
+            for manifest in (
+                user_session_service_k8s_deployment_manifests
+                + orchest_session_service_k8s_deployment_manifests
+            )
+        ],
+        should_abort,
+    )
 
-    logger.info("Creating Orchest session services k8s ingresses.")
-    for manifest in orchest_session_service_k8s_ingress_manifests:
-        logger.info(f'Creating ingress {manifest["metadata"]["name"]}')
-        k8s_networking_api.create_namespaced_ingress(
-            ns,
-            manifest,
-        )
 
-    logger.info("Creating user session services deployments.")
-    for manifest in user_session_service_k8s_deployment_manifests:
-        logger.info(f'Creating deployment {manifest["metadata"]["name"]}')
-        k8s_apps_api.create_namespaced_deployment(
-            ns,
-            manifest,
-        )
+def _get_interactive_orchest_session_services_manifests(
+    session_uuid: str, session_config: SessionConfig
+) -> Tuple[List[dict], List[dict], List[dict], List[dict]]:
+    """Gets the manifests of the jupyter-eg and jupyter-server services.
 
-    logger.info("Creating user session services k8s services.")
-    for manifest in user_session_service_k8s_service_manifests:
-        logger.info(f'Creating service {manifest["metadata"]["name"]}')
-        k8s_core_api.create_namespaced_service(
-            ns,
-            manifest,
+    Returns:
+        Tuple of the RBAC, deployment, service and ingress manifests.
+    """
+    rbac_manifests = list(
+        _manifests._get_jupyter_enterprise_gateway_rbac_manifests(
+            session_uuid, session_config
         )
+    )
+    (
+        eg_depl,
+        eg_serv,
+    ) = _manifests._get_jupyter_enterprise_gateway_deployment_service_manifest(
+        session_uuid, session_config, SessionType.INTERACTIVE
+    )
+    (
+        server_depl,
+        server_serv,
+        server_ingress,
+    ) = _manifests._get_jupyter_server_deployment_service_manifest(
+        session_uuid, session_config
+    )
+    return (
+        rbac_manifests,
+        [eg_depl, server_depl],
+        [eg_serv, server_serv],
+        [server_ingress],
+    )
 
-    logger.info("Creating user session services k8s ingresses.")
-    for manifest in user_session_service_k8s_ingress_manifests:
-        logger.info(f'Creating ingress {manifest["metadata"]["name"]}')
-        k8s_networking_api.create_namespaced_ingress(
-            ns,
-            manifest,
-        )
 
-    logger.info("Waiting for user and orchest session service deployments to be ready.")
-    for manifest in (
-        user_session_service_k8s_deployment_manifests
-        + orchest_session_service_k8s_deployment_manifests
-    ):
-        name = manifest["metadata"]["name"]
-        deployment = k8s_apps_api.read_namespaced_deployment_status(name, ns)
-        while deployment.status.available_replicas != deployment.spec.replicas:
-            if should_abort():
-                return
-            logger.info(f"Waiting for {name}.")
-            time.sleep(1)
-            deployment = k8s_apps_api.read_namespaced_deployment_status(name, ns)
+def _get_noninteractive_orchest_session_services_manifests(
+    session_uuid: str, session_config: SessionConfig
+) -> Tuple[List[dict], List[dict], List[dict], List[dict]]:
+    """Non-interactive sessions have no orchest services of their own.
+
+    The session sidecar is added for any type of session that has user
+    services.
+    """
+    return [], [], [], []
+
+
+# Gets the RBAC, deployment, service and ingress manifests of the
+# orchest services that are specific to a session type.
+_ORCHEST_SESSION_SERVICES_MANIFESTS_GETTERS = {
+    SessionType.INTERACTIVE: _get_interactive_orchest_session_services_manifests,
+    SessionType.NONINTERACTIVE: _get_noninteractive_orchest_session_services_manifests,
+}
 
 
 def shutdown(session_uuid: str, wait_for_completion: bool = False):
@@ -264,7 +265,12 @@ def cleanup_resources(session_uuid: str, wait_for_completion: bool = False):
     for resource_name, list_f, _ in resources_to_delete:
         logger.info(f"Getting {resource_name} for deletion.")
         resource_list_threads.append(
-            list_f(ns, label_selector=label_selector, async_req=True)
+            list_f(
+                ns,
+                label_selector=label_selector,
+                async_req=True,
+                _preload_content=False,
+            )
         )
 
     # Delete all obtained entities.
@@ -277,12 +283,9 @@ def cleanup_resources(session_uuid: str, wait_for_completion: bool = False):
         # resources.
         try:
             logger.info(f"Deleting {resource_name}.")
-            entities = thread.get()
-            for entity in entities.items:
-                logger.info(f"Deleting {entity.metadata.name}")
-                resource_delete_threads.append(
-                    delete_f(entity.metadata.name, ns, async_req=True)
-                )
+            for name in _get_resource_names(thread.get()):
+                logger.info(f"Deleting {name}")
+                resource_delete_threads.append(delete_f(name, ns, async_req=True))
         except Exception as e:
             logger.error(str(e))
             exceptions.append(e)
@@ -309,40 +312,36 @@ def cleanup_resources(session_uuid: str, wait_for_completion: bool = False):
 
     if not wait_for_completion:
         return
-    # Else keep listing resources until no resources are there.
-    tries = 1000
-    while resources_to_delete and tries > 0:
-        logger.info("Waiting for resources to be deleted.")
-        tmp_resources = []
-
-        resource_list_threads = []
-        for resource_name, list_f, _ in resources_to_delete:
-            resource_list_threads.append(
-                list_f(ns, label_selector=label_selector, async_req=True)
-            )
-        for (resource_name, list_f, delete_f), thread in zip(
-            resources_to_delete, resource_list_threads
-        ):
-            if thread.get().items:
-                logger.info(f"{resource_name} deletion not complete.")
-                tmp_resources.append((resource_name, list_f, delete_f))
-
-        resources_to_delete = tmp_resources
-        tries -= 1
-        time.sleep(1)
-
-    if resources_to_delete:
-        raise errors.SessionCleanupFailedError()
+    # Else wait for the deletion of the resources to be complete.
+    deadline = time.monotonic() + 1000
+    # Every Watch builds its own ApiClient, share it across the waits.
+    w = kubernetes.watch.Watch(return_type="object")
+    for resource_name, list_f, _ in resources_to_delete:
+        logger.info(f"Waiting for {resource_name} to be deleted.")
+        if not _wait_for_resources_deletion(w, ns, label_selector, list_f, deadline):
+            logger.error(f"{resource_name} deletion not complete.")
+            raise errors.SessionCleanupFailedError()
 
 
-def has_busy_kernels(session_uuid: str) -> bool:
+def has_busy_kernels(session_uuid: str, force: bool = False) -> bool:
     """Tells if the session has busy kernels.
 
     Args:
-        session_config: Requires a "project_uuid" and a
-        "pipeline_uuid".
+        session_uuid: UUID of the interactive session.
+        force: If True, the kernels are always queried instead of
+            possibly using the result of a query made less than
+            _BUSY_KERNELS_CACHE_TTL seconds ago.
 
     """
+    if not force:
+        with _busy_kernels_cache_lock:
+            cached = _busy_kernels_cache.get(session_uuid)
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < _BUSY_KERNELS_CACHE_TTL
+        ):
+            return cached[1]
+
     # https://jupyter-server.readthedocs.io/en/latest/developers/rest-api.html
     service_name = f"jupyter-server-{session_uuid}"
     # Coupled with the jupyter-server service port.
@@ -366,24 +365,307 @@ def has_busy_kernels(session_uuid: str) -> bool:
     # 'last_activity': '2021-11-10T09:04:10.508031Z',
     # 'execution_state': 'idle', 'connections': 2}]
     kernels: List[dict] = response.json()
-    return any(kernel.get("execution_state") == "busy" for kernel in kernels)
+    busy = any(kernel.get("execution_state") == "busy" for kernel in kernels)
+
+    with _busy_kernels_cache_lock:
+        now = time.monotonic()
+        # Drop expired entries so that the cache doesn't grow with every
+        # session that has ever been queried.
+        for uuid in [
+            uuid
+            for uuid, (query_time, _) in _busy_kernels_cache.items()
+            if now - query_time >= _BUSY_KERNELS_CACHE_TTL
+        ]:
+            del _busy_kernels_cache[uuid]
+        _busy_kernels_cache[session_uuid] = (now, busy)
+
+    return busy
 
 
 def restart_session_service(
     session_uuid: str, service_name: str, wait_for_readiness: bool = True
 ) -> None:
-    """Restarts a session service by name."""
+    """Restarts a session service by name.
+
+    Works like `kubectl rollout restart`, the pod template of the
+    deployment is annotated so that the deployment controller replaces
+    the pods according to the deployment strategy.
+    """
     ns = _config.ORCHEST_NAMESPACE
-    k8s_core_api.delete_collection_namespaced_pod(
-        namespace=ns, label_selector=f"session_uuid={session_uuid},app={service_name}"
+    dname = f"{service_name}-{session_uuid}"
+    k8s_apps_api.patch_namespaced_deployment(
+        dname,
+        ns,
+        {
+            "spec": {
+                "template": {
+                    "metadata": {
+                        "annotations": {
+                            "orchest.io/restartedAt": datetime.utcnow().isoformat()
+                        }
+                    }
+                }
+            }
+        },
     )
 
     if wait_for_readiness:
-        dname = f"{service_name}-{session_uuid}"
-        deployment = k8s_apps_api.read_namespaced_deployment_status(dname, ns)
-        while deployment.status.ready_replicas != deployment.spec.replicas:
-            time.sleep(1)
-            deployment = k8s_apps_api.read_namespaced_deployment_status(dname, ns)
+        _wait_for_deployments_rollout(
+            ns,
+            f"session_uuid={session_uuid},app={service_name}",
+            [dname],
+            _always_false,
+        )
+
+
+def _apply_manifests(ns: str, manifests: List[dict]) -> None:
+    """Concurrently creates or updates the given resources.
+
+    Resources are applied through server-side apply, which makes the
+    operation idempotent, e.g. when retrying a launch for which some
+    resources were already created. The requests don't depend on each
+    other, thus they are all sent using the async_req functionality of
+    the k8s client and waited for afterwards.
+
+    Args:
+        ns: Namespace in which to apply the resources.
+        manifests: Manifests of the resources, the kind of every
+            resource must be in _KIND_TO_K8S_API_AND_RESOURCE.
+
+    Raises:
+        The first exception that was encountered, after all requests
+        have terminated.
+    """
+    resource_apply_threads = []
+    for manifest in manifests:
+        logger.info(f'Applying {manifest["kind"]} {manifest["metadata"]["name"]}')
+        resource_apply_threads.append(_server_side_apply(ns, manifest, async_req=True))
+
+    exceptions = []
+    for thread in resource_apply_threads:
+        try:
+            thread.get()
+        except Exception as e:
+            logger.error(str(e))
+            exceptions.append(e)
+
+    if exceptions:
+        raise exceptions[0]
+
+
+def _server_side_apply(ns: str, manifest: dict, async_req: bool = False):
+    """Server-side applies a namespaced resource.
+
+    The generated methods of the k8s client don't allow to set the
+    "application/apply-patch+yaml" content type, thus the request is
+    made through the ApiClient. Note that JSON is valid YAML.
+
+    The manifest is serialized once, compactly, and the applied object
+    echoed back by the k8s API is not deserialized since it's unused.
+    """
+    k8s_api, resource = _KIND_TO_K8S_API_AND_RESOURCE[manifest["kind"]]
+    api_version = manifest["apiVersion"]
+    # Core resources, e.g. "v1", don't have an API group.
+    api_prefix = "/apis" if "/" in api_version else "/api"
+    return k8s_api.api_client.call_api(
+        f"{api_prefix}/{api_version}/namespaces/{{namespace}}/{resource}/{{name}}",
+        "PATCH",
+        path_params={"namespace": ns, "name": manifest["metadata"]["name"]},
+        query_params=[("fieldManager", "orchest-api"), ("force", True)],
+        header_params={
+            "Accept": "application/json",
+            "Content-Type": "application/apply-patch+yaml",
+        },
+        body=json.dumps(manifest, separators=(",", ":")),
+        response_type=None,
+        auth_settings=["BearerToken"],
+        async_req=async_req,
+        _return_http_data_only=True,
+    )
+
+
+def _wait_for_deployments_rollout(
+    ns: str,
+    label_selector: str,
+    names: Iterable[str],
+    should_abort: Callable,
+    watch_timeout: int = 1,
+) -> bool:
+    """Waits for the rollout of some deployments to be complete.
+
+    Instead of polling the status of every deployment a single watch on
+    the deployments matching `label_selector` is used, so that the wait
+    is over as soon as k8s reports the last of them as ready. The watch
+    is (re)opened in chunks of `watch_timeout` seconds to be able to
+    check `should_abort` even if no events come in, so that an abort is
+    noticed within `watch_timeout` seconds. `should_abort` is otherwise
+    only called when a deployment becomes ready, since it can be
+    costly, e.g. a db query. A chunk whose connection stalls is ended
+    by a client side read timeout.
+
+    Args:
+        ns: Namespace of the deployments.
+        label_selector: Must select all deployments in `names`, other
+            deployments it selects are ignored.
+        names: Names of the deployments to wait for.
+        should_abort: See the args of `launch`.
+        watch_timeout: Duration in seconds of every watch request.
+
+    Returns:
+        False if the wait was aborted through `should_abort`, True
+        otherwise.
+    """
+    not_ready = set(names)
+    if not not_ready:
+        return True
+
+    # Deserialize events to plain dicts instead of k8s client models,
+    # only a handful of status fields are needed.
+    w = kubernetes.watch.Watch(return_type="object")
+    while True:
+        try:
+            for event in w.stream(
+                k8s_apps_api.list_namespaced_deployment,
+                ns,
+                label_selector=label_selector,
+                timeout_seconds=watch_timeout,
+                _request_timeout=(
+                    _K8S_CONNECT_TIMEOUT,
+                    watch_timeout + _WATCH_READ_TIMEOUT_SLACK,
+                ),
+            ):
+                deployment = event["object"]
+                name = deployment["metadata"]["name"]
+                # Every (re)opened watch replays an ADDED event for
+                # every deployment, only events that change the set of
+                # deployments that aren't ready are of interest.
+                if (
+                    name in not_ready
+                    and event["type"] != "DELETED"
+                    and _is_deployment_rolled_out(deployment)
+                ):
+                    not_ready.discard(name)
+                    if not not_ready:
+                        w.stop()
+                        return True
+                    if should_abort():
+                        w.stop()
+                        return False
+        except urllib3.exceptions.ReadTimeoutError:
+            # The watch stalled, handle it like the end of a chunk.
+            pass
+        if should_abort():
+            return False
+        logger.info(f"Waiting for {', '.join(sorted(not_ready))}.")
+
+
+def _is_deployment_rolled_out(deployment: dict) -> bool:
+    """Tells if all replicas of a deployment are updated and available.
+
+    Mirrors the checks done by `kubectl rollout status`. Checking only
+    the available replicas is not enough when restarting a deployment,
+    since the old pods are kept around until the new ones are ready.
+
+    Args:
+        deployment: The deployment as returned by the k8s API, i.e. not
+            deserialized into a k8s client model.
+    """
+    status = deployment.get("status", {})
+    replicas = deployment["spec"]["replicas"]
+    return (
+        status.get("observedGeneration", 0) >= deployment["metadata"]["generation"]
+        and status.get("updatedReplicas") == replicas
+        and status.get("replicas") == replicas
+        and status.get("availableReplicas") == replicas
+    )
+
+
+def _wait_for_resources_deletion(
+    w: kubernetes.watch.Watch,
+    ns: str,
+    label_selector: str,
+    list_f: Callable,
+    deadline: float,
+) -> bool:
+    """Waits for the deletion of the resources matching a selector.
+
+    The resources are listed, then a watch starting from the resource
+    version of the list is used to get notified of their deletion,
+    instead of polling. Resources added after the list, e.g. a pod
+    created by a ReplicaSet that is yet to be deleted, are waited for
+    as well. If the watch ends early, e.g. because the connection was
+    closed or stalled or the resource version expired, the resources
+    are listed again and a new watch is started.
+
+    Args:
+        w: Watch to use, created with return_type="object".
+        ns: Namespace of the resources.
+        label_selector: Selects the resources to wait for.
+        list_f: The k8s API function to list the resources with, e.g.
+            list_namespaced_pod.
+        deadline: time.monotonic() value after which to stop waiting.
+
+    Returns:
+        True if all resources have been deleted, False if the deadline
+        was reached.
+    """
+    while time.monotonic() < deadline:
+        resource_list = _load_json_response(
+            list_f(ns, label_selector=label_selector, _preload_content=False)
+        )
+        not_deleted = {item["metadata"]["name"] for item in resource_list["items"]}
+        if not not_deleted:
+            return True
+
+        timeout = max(1, int(deadline - time.monotonic()))
+        try:
+            for event in w.stream(
+                list_f,
+                ns,
+                label_selector=label_selector,
+                resource_version=resource_list["metadata"]["resourceVersion"],
+                timeout_seconds=timeout,
+                # Don't rely on the server closing the watch to respect
+                # the deadline.
+                _request_timeout=(
+                    _K8S_CONNECT_TIMEOUT,
+                    timeout + _WATCH_READ_TIMEOUT_SLACK,
+                ),
+            ):
+                name = event["object"]["metadata"]["name"]
+                if event["type"] == "ADDED":
+                    not_deleted.add(name)
+                elif event["type"] == "DELETED":
+                    not_deleted.discard(name)
+                    if not not_deleted:
+                        w.stop()
+                        return True
+        except kubernetes.client.exceptions.ApiException as e:
+            # The resource version of the list expired, list again.
+            if e.status != 410:
+                raise
+        except urllib3.exceptions.ReadTimeoutError:
+            # The watch stalled, list again.
+            pass
+    return False
+
+
+def _get_resource_names(response: urllib3.HTTPResponse) -> List[str]:
+    """Gets the names of the resources of a k8s list response.
+
+    To be used on responses of requests made with
+    `_preload_content=False`, to avoid deserializing all resources into
+    k8s client models when only their names are needed.
+    """
+    return [item["metadata"]["name"] for item in _load_json_response(response)["items"]]
+
+
+def _load_json_response(response: urllib3.HTTPResponse) -> dict:
+    """Loads the body of a `_preload_content=False` response."""
+    try:
+        return json.loads(response.data)
+    finally:
+        response.release_conn()
 
 
 @contextmanager
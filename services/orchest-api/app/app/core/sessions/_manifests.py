@@ -1,7 +1,8 @@
 """Collection of function to generate k8s manifests.
 
-Note that pod labels are coupled with how we restart services, which
-is done by deleting all pods with the given labels.
+Note that deployment names are coupled with how we restart services,
+which is done by annotating the pod template of the deployment named
+"<service name>-<session uuid>".
 """
 import copy
 import json
@@ -896,12 +897,22 @@ def _get_user_service_deployment_service_manifest(
         if inherited_key in user_env_variables:
             environment[inherited_key] = user_env_variables[inherited_key]
 
-    env = _get_orchest_sdk_vars(
-        project_uuid, pipeline_uuid, _config.PIPELINE_FILE, session_uuid, session_type
-    )
-
+    # Server-side apply rejects env vars with duplicate names. User
+    # defined env vars take precedence over the SDK ones, like they did
+    # when duplicates were passed to k8s, which uses the last entry.
+    env = {
+        var["name"]: var
+        for var in _get_orchest_sdk_vars(
+            project_uuid,
+            pipeline_uuid,
+            _config.PIPELINE_FILE,
+            session_uuid,
+            session_type,
+        )
+    }
     for k, v in environment.items():
-        env.append({"name": k, "value": v})
+        env[k] = {"name": k, "value": v}
+    env = list(env.values())
 
     volume_mounts = []
     volumes = []
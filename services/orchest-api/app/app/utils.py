@@ -918,7 +918,14 @@ _retry_strategy = Retry(
     method_whitelist=["GET", "PUT"],
     backoff_factor=1,
 )
-_rq_adapter = requests.adapters.HTTPAdapter(max_retries=_retry_strategy)
+# Shared by all sessions returned by get_session_with_retries, so that
+# connections are reused across them. The adapter keeps a connection
+# pool per host, e.g. per jupyter-server service when querying the
+# kernels of all sessions, the default of 10 pools would have them
+# evicted as soon as there are more sessions.
+_rq_adapter = requests.adapters.HTTPAdapter(
+    max_retries=_retry_strategy, pool_connections=32
+)
 
 
 def get_session_with_retries() -> requests.Session:
@@ -0,0 +1,93 @@
+import pytest
+
+import app.core.sessions._core
+import app.core.sessions._manifests
+from _orchest.internals import config as _config
+from app.core import pod_scheduling
+from app.types import SessionType
+
+
+def test_user_service_env_variables_are_unique(monkeypatch):
+    monkeypatch.setenv("ORCHEST_HOST_GID", "1")
+    monkeypatch.setattr(
+        pod_scheduling,
+        "modify_user_service_scheduling_behaviour",
+        lambda *args, **kwargs: None,
+    )
+
+    session_config = {
+        "project_uuid": "project-uuid",
+        "pipeline_uuid": "pipeline-uuid",
+        "pipeline_path": "pipeline.orchest",
+        "project_dir": "/userdir/projects/my-project",
+        "userdir_pvc": "userdir-pvc",
+        "env_uuid_to_image": {},
+        "user_env_variables": {"INHERITED": "inherited-value"},
+    }
+    service_config = {
+        "name": "my-service",
+        "image": "my-image",
+        "scope": ["noninteractive"],
+        "ports": [80],
+        "exposed": False,
+        "env_variables": {"ORCHEST_PIPELINE_PATH": "/custom"},
+        "env_variables_inherit": ["INHERITED"],
+    }
+
+    (
+        deployment_manifest,
+        _,
+        _,
+    ) = app.core.sessions._manifests._get_user_service_deployment_service_manifest(
+        "session-uuid",
+        session_config,
+        service_config,
+        SessionType.NONINTERACTIVE,
+    )
+
+    env = deployment_manifest["spec"]["template"]["spec"]["containers"][0]["env"]
+    names = [var["name"] for var in env]
+    assert len(names) == len(set(names))
+
+    env = {var["name"]: var["value"] for var in env}
+    # User defined env vars take precedence over the SDK ones.
+    assert env["ORCHEST_PIPELINE_PATH"] == "/custom"
+    assert env["ORCHEST_PIPELINE_PATH"] != _config.PIPELINE_FILE
+    assert env["ORCHEST_SESSION_UUID"] == "session-uuid"
+    assert env["INHERITED"] == "inherited-value"
+
+
+def _deployment(spec_replicas=1, generation=2, **status):
+    status = {
+        "observedGeneration": generation,
+        "replicas": spec_replicas,
+        "updatedReplicas": spec_replicas,
+        "availableReplicas": spec_replicas,
+        **status,
+    }
+    return {
+        "metadata": {"generation": generation},
+        "spec": {"replicas": spec_replicas},
+        "status": status,
+    }
+
+
+@pytest.mark.parametrize(
+    "deployment,expected",
+    [
+        (_deployment(), True),
+        (_deployment(spec_replicas=2), True),
+        # The controller hasn't observed the latest spec yet.
+        (_deployment(observedGeneration=1), False),
+        # Old pods of a restart are still available.
+        (_deployment(replicas=2, availableReplicas=2), False),
+        (_deployment(replicas=2, updatedReplicas=1, availableReplicas=1), False),
+        # New pods aren't available yet.
+        (_deployment(updatedReplicas=0), False),
+        (_deployment(availableReplicas=0), False),
+        # Freshly created, no status yet.
+        ({"metadata": {"generation": 1}, "spec": {"replicas": 1}}, False),
+    ],
+)
+def test_is_deployment_rolled_out(deployment, expected):
+    assert app.core.sessions._core._is_deployment_rolled_out(deployment) == expected